@@ -1,6 +1,29 @@
 """Exchange abstraction layer."""
 
+import os
+import sys
+
+# EXCHANGE_CORE_UVLOOP=1 の場合はuvloopのイベントループを使用.
+# ポリシーはこれ以降に作成されるループにのみ効くため、asyncio.run() より前にimportする必要がある.
+# asyncio.set_event_loop_policy はPython 3.14で非推奨のため3.13以前でのみ設定する.
+# 3.14以降や確実に適用したい場合は uvloop.run(main()) でループを起動する
+if os.environ.get("EXCHANGE_CORE_UVLOOP") == "1":
+    if sys.version_info < (3, 14):
+        import asyncio
+
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    else:
+        import warnings
+
+        warnings.warn(
+            "EXCHANGE_CORE_UVLOOP はPython 3.14以降では無視されます. uvloop.run(main()) を使用してください",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
 from exchange_core.hyperliquid import HyperliquidExchange
-from exchange_core.interface import IExchange, OHLCV, Order, Orderbook, Position, Ticker
+from exchange_core.interface import IExchange, OHLCV, Order, Orderbook, Position, Snapshot, Ticker, enc_hook
 
-__all__ = ["IExchange", "Ticker", "Position", "Order", "Orderbook", "OHLCV", "HyperliquidExchange"]
+__all__ = ["IExchange", "Ticker", "Position", "Order", "Orderbook", "OHLCV", "Snapshot", "HyperliquidExchange", "enc_hook"]
@@ -0,0 +1,94 @@
+"""レスポンス変換の高速化ヘルパー."""
+
+from collections.abc import Callable
+from itertools import chain
+from typing import cast
+
+import msgspec
+import numpy as np
+
+# ループを展開した板パーサーを生成する最大段数（これを超える板は np.fromiter で変換）.
+# Hyperliquidの板は1サイド20段. 段数が増えるとタプル構築のコストで展開の効果がなくなる
+_MAX_UNROLLED_DEPTH = 20
+
+# 段数 -> その段数専用に生成した板パーサー
+_LevelsParser = Callable[[list[list[float]]], np.ndarray]
+_unrolled_parsers: dict[int, _LevelsParser] = {}
+
+
+def parse_levels(levels: list[list[float]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    ccxtの板情報 [[price, amount], ...] を価格配列と数量配列（float64）に分解.
+
+    各レベルの先頭2要素を価格・数量として使う（3要素目以降は無視）. 数値文字列も受け付ける.
+    返す2つの配列はそれぞれC連続で、1つのバッファを共有する.
+    """
+    depth = len(levels)
+    if 0 < depth <= _MAX_UNROLLED_DEPTH:
+        prices, sizes = _unrolled_parser(depth)(levels)
+        return prices, sizes
+
+    # 3要素以上のレベルでも列がずれないよう、価格・数量だけを取り出して平坦化する
+    flat = np.fromiter(
+        chain.from_iterable((lvl[0], lvl[1]) for lvl in levels), dtype=np.float64, count=2 * depth
+    )
+    prices, sizes = flat.reshape(-1, 2).T.copy()
+    return prices, sizes
+
+
+def _unrolled_parser(depth: int) -> _LevelsParser:
+    """
+    指定段数専用の板パーサーを取得（初回のみ生成）.
+
+    板の段数は取引所の設定でほぼ固定のため、段数毎にループを展開したコードを生成する.
+    価格・数量の順に並べたタプルから shape=(2, depth) の配列を直接作るので、
+    イテレータの走査や転置コピーが不要になる.
+    """
+    parser = _unrolled_parsers.get(depth)
+    if parser is None:
+        prices = ", ".join(f"levels[{i}][0]" for i in range(depth))
+        sizes = ", ".join(f"levels[{i}][1]" for i in range(depth))
+        source = (
+            "def parse(levels):\n"
+            f"    return np.array(({prices}, {sizes}), dtype=np.float64).reshape(2, {depth})\n"
+        )
+        namespace = {"np": np}
+        exec(source, namespace)
+        parser = _unrolled_parsers[depth] = cast(_LevelsParser, namespace["parse"])
+    return parser
+
+
+# parse_ohlcv が返す構造化配列のdtype
+OHLCV_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),
+        ("open", np.float64),
+        ("high", np.float64),
+        ("low", np.float64),
+        ("close", np.float64),
+        ("volume", np.float64),
+    ]
+)
+_OHLCV_FIELDS: tuple[str, ...] = OHLCV_DTYPE.names or ()
+
+
+def parse_ohlcv(candles: list[list[float]]) -> np.ndarray:
+    """
+    ccxtのローソク足 [[timestamp, open, high, low, close, volume], ...] を構造化配列に変換.
+
+    np.fromiter で一括してfloat64に変換した後、列ごとにOHLCV_DTYPEの各フィールドへ書き込む.
+    欠損値（None）を含む場合は msgspec.convert による OHLCV への変換と同じく
+    msgspec.ValidationError を送出する.
+    """
+    width = len(_OHLCV_FIELDS)
+    flat = np.fromiter(chain.from_iterable(candles), dtype=np.float64, count=width * len(candles))
+    # fromiter はNoneをNaNに変換するため、変換後に欠損を検出する
+    missing = np.flatnonzero(np.isnan(flat))
+    if missing.size:
+        row, col = divmod(int(missing[0]), width)
+        raise msgspec.ValidationError(f"Expected `float`, got `null` - at `$[{row}][{col}]`")
+    columns = flat.reshape(-1, width)
+    out = np.empty(len(candles), dtype=OHLCV_DTYPE)
+    for i, name in enumerate(_OHLCV_FIELDS):
+        out[name] = columns[:, i]
+    return out
@@ -1,59 +1,287 @@
 """Hyperliquid取引所クライアント実装."""
 
-from typing import Literal, Self
+from __future__ import annotations
 
-import ccxt.async_support as ccxt_async
+import asyncio
+import logging
+import math
+import socket
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Literal, Self
 
-from exchange_core.interface import IExchange, OHLCV, Order, Orderbook, Position, Ticker
+import msgspec
+import numpy as np
+
+from exchange_core._fastparse import parse_levels, parse_ohlcv
+from exchange_core.interface import IExchange, OHLCV, Order, Orderbook, Position, Snapshot, Ticker
+
+if TYPE_CHECKING:
+    import aiohttp
+    import ccxt.pro as ccxt_pro
+
+logger = logging.getLogger(__name__)
+
+# ポジション一覧のキャッシュ有効期間（秒）
+_POSITIONS_TTL = 0.1
+
+# WebSocketで最後に受信してからこの秒数を超えた購読データは使わずRESTで取得する
+_STREAM_MAX_AGE = 2.0
+
+
+def _to_float(value: float | str | None) -> float:
+    """ccxtの数値フィールドをfloatに変換（Noneは0.0）. 既にfloatの場合は変換を省く."""
+    if value is None:
+        return 0.0
+    return value if type(value) is float else float(value)
+
+
+def _to_price(value: float | str | None) -> float:
+    """ccxtの価格フィールドをfloatに変換（NoneはNaN）. 0.0と誤認されないよう欠損はNaNで表す."""
+    if value is None:
+        return math.nan
+    return value if type(value) is float else float(value)
 
 
 class HyperliquidExchange(IExchange):
-    """ccxt経由のHyperliquid取引所クライアント."""
+    """
+    ccxt経由のHyperliquid取引所クライアント.
+
+    DTOのsymbolは sys.intern() したものを設定するため、同じシンボルは常に同一のstrオブジェクトとなり、
+    シンボルをキーにした辞書の参照や比較が高速になる.
+    """
 
-    def __init__(self, exchange: ccxt_async.hyperliquid):
+    def __init__(self, exchange: ccxt_pro.hyperliquid, ready: asyncio.Task | None = None):
+        """
+        Args:
+            exchange: ccxtのHyperliquidクライアント
+            ready: マーケット情報を読み込み中のタスク（create_nowait から渡される）.
+                Noneの場合はccxtが最初の通信時に読み込む
+        """
         self._exchange = exchange
+        # 各メソッドは通信前に _ensure_ready() で読み込みの完了を待つ
+        self._ready = ready
+        if ready is not None:
+            ready.add_done_callback(self._on_markets_loaded)
+        # perp dex名（デフォルトのdexはNone） -> (取得時刻, シンボル -> ccxtのポジション)
+        self._positions_cache: dict[str | None, tuple[float, dict[str, dict]]] = {}
+        self._positions_locks: dict[str | None, asyncio.Lock] = {}
+        # HIP-3 dex毎のfetch_positions用params（ccxtはparamsを変更しないため使い回す）
+        self._dex_params: dict[str, dict[str, str]] = {}
+        # 注文毎に増やす世代番号. 取得中に変わった場合は結果をキャッシュしない
+        self._positions_generation = 0
+        # WebSocket購読中のシンボル -> 購読数
+        self._orderbook_streams: dict[str, int] = {}
+        self._ticker_streams: dict[str, int] = {}
+        # WebSocket購読中のシンボル -> 最後に受信した時刻（time.monotonic()）
+        self._orderbook_received: dict[str, float] = {}
+        self._ticker_received: dict[str, float] = {}
 
     @classmethod
     async def create(cls, config: dict) -> Self:
         """
-        ファクトリメソッド.
+        ファクトリメソッド. マーケット情報の読み込み完了後に返す.
 
         Args:
             config: ccxt設定辞書
                 - walletAddress: str - ウォレットアドレス
                 - privateKey: str - 秘密鍵
+
+        Note:
+            uvloopのイベントループで動作させる場合は uvloop.run(main()) で起動する
+            （`pip install exchange-core[uvloop]` が必要）.
+            Python 3.13以前では、ループ作成前（asyncio.run() より前）に
+            環境変数 EXCHANGE_CORE_UVLOOP=1 でimportすることでも切り替えられる.
+        """
+        client = cls.create_nowait(config)
+        try:
+            await client._ensure_ready()
+        except BaseException:
+            # 作成済みのセッションを解放してから送出する
+            await client.close()
+            raise
+        return client
+
+    @classmethod
+    def create_nowait(cls, config: dict) -> Self:
+        """
+        マーケット情報の読み込みを待たずにクライアントを作成.
+
+        読み込みはバックグラウンドで行われ、最初の通信時に完了を待つ.
+        他の初期化処理と並行して起動時間を短縮したい場合に使う.
+        実行中のイベントループ内から呼ぶ必要がある.
+
+        Args:
+            config: ccxt設定辞書（create と同じ）.
+                "session" を指定した場合はそのセッションをそのまま使い、クローズもしない
+        """
+        # ccxtは全取引所のクラスを読み込むためimportが重く、クライアント作成時まで遅延させる
+        import ccxt.pro as ccxt_pro
+
+        loop = asyncio.get_running_loop()
+        exchange = ccxt_pro.hyperliquid(config)
+        if "session" not in config:
+            exchange.session = cls._create_session(exchange)
+        return cls(exchange, ready=loop.create_task(exchange.load_markets()))
+
+    def _on_markets_loaded(self, task: asyncio.Task) -> None:
+        """
+        マーケット情報の読み込み完了時のコールバック.
+
+        失敗した場合もタスクの例外をここで回収してログに記録する.
+        以降の通信ではccxtが読み込みを再試行する.
+        """
+        self._ready = None
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.warning("マーケット情報の読み込みに失敗しました（次回の通信時に再試行）: %r", error)
+
+    async def _ensure_ready(self) -> None:
+        """マーケット情報の読み込み中であれば完了を待つ（失敗した場合は例外を送出）."""
+        if self._ready is not None:
+            await self._ready
+
+    @staticmethod
+    def _create_session(exchange: ccxt_pro.hyperliquid) -> aiohttp.ClientSession:
+        """
+        接続プールの設定を調整したaiohttpセッションを作成.
+
+        ccxtが既定で作成するセッションと同じ設定に、同時接続数・DNSキャッシュ・
+        keep-alive時間の調整を加えたもの. セッションはccxtの close() でクローズされる.
+        呼び出し側のセッションが指定されていない（own_sessionが真の）場合にのみ使う.
         """
-        exchange = ccxt_async.hyperliquid(config)
-        await exchange.load_markets()
-        return cls(exchange)
+        import aiohttp
+
+        # SSLコンテキストはccxtの open() に作成させる（include_OS_certificates等の設定を反映）.
+        # own_sessionを一時的に外し、ccxt既定のセッションは作成させない
+        own_session = exchange.own_session
+        exchange.own_session = False
+        try:
+            exchange.open()
+        finally:
+            exchange.own_session = own_session
+
+        connector = aiohttp.TCPConnector(
+            # ccxtの既定と同じ設定
+            ssl=exchange.ssl_context,
+            enable_cleanup_closed=True,
+            family=socket.AF_UNSPEC,
+            happy_eyeballs_delay=0,
+            # 調整した設定
+            limit=0,  # 同時接続数の上限なし（流量はccxtのレートリミッタで制御）
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        return aiohttp.ClientSession(connector=connector, trust_env=exchange.aiohttp_trust_env)
 
     async def get_orderbook(self, symbol: str) -> Orderbook:
         """
         指定シンボルのオーダーブックを取得.
 
+        stream_orderbook で購読中かつ _STREAM_MAX_AGE 秒以内に受信している場合は、
+        RESTを使わずWebSocketで受信済みの板を返す.
+        購読側が yield で止まったまま受信が途絶えた場合はRESTで取得する.
+
         Args:
             symbol: ccxt形式のシンボル（例: "BTC/USDC:USDC"）
         """
+        if self._is_stream_fresh(self._orderbook_received, symbol):
+            response = self._exchange.orderbooks.get(symbol)
+            if response is not None:
+                return self._to_orderbook(response)
+
+        await self._ensure_ready()
         response = await self._exchange.fetch_order_book(symbol)
-        return Orderbook(
-            asks=[[float(ask[0]), float(ask[1])] for ask in response["asks"]],
-            bids=[[float(bid[0]), float(bid[1])] for bid in response["bids"]],
-        )
+        return self._to_orderbook(response)
 
     async def get_ticker(self, symbol: str) -> Ticker:
         """
         指定シンボルの価格情報を取得.
 
+        stream_ticker で購読中かつ _STREAM_MAX_AGE 秒以内に受信している場合は、
+        RESTを使わずWebSocketで受信済みの価格を返す.
+        購読側が yield で止まったまま受信が途絶えた場合はRESTで取得する.
+
         Args:
             symbol: ccxt形式のシンボル（例: "BTC/USDC:USDC"）
         """
+        if self._is_stream_fresh(self._ticker_received, symbol):
+            response = self._exchange.tickers.get(symbol)
+            if response is not None:
+                return self._to_ticker(symbol, response)
+
+        await self._ensure_ready()
         response = await self._exchange.fetch_ticker(symbol)
-        return Ticker(
-            symbol=symbol,
-            last=float(response["last"]),
-            bid=float(response["bid"]),
-            ask=float(response["ask"]),
-        )
+        return self._to_ticker(symbol, response)
+
+    async def stream_orderbook(self, symbol: str) -> AsyncIterator[Orderbook]:
+        """
+        WebSocketでオーダーブックの更新を購読.
+
+        最後の購読が終了するとWebSocketの購読も解除する.
+
+        Args:
+            symbol: ccxt形式のシンボル（例: "BTC/USDC:USDC"）
+        """
+        await self._ensure_ready()
+        self._orderbook_streams[symbol] = self._orderbook_streams.get(symbol, 0) + 1
+        try:
+            while True:
+                response = await self._exchange.watch_order_book(symbol)
+                self._orderbook_received[symbol] = time.monotonic()
+                yield self._to_orderbook(response)
+        finally:
+            await self._release_stream(
+                self._orderbook_streams, self._orderbook_received, symbol, self._exchange.un_watch_order_book
+            )
+
+    async def stream_ticker(self, symbol: str) -> AsyncIterator[Ticker]:
+        """
+        WebSocketで価格情報の更新を購読.
+
+        最後の購読が終了するとWebSocketの購読も解除する.
+
+        Args:
+            symbol: ccxt形式のシンボル（例: "BTC/USDC:USDC"）
+        """
+        await self._ensure_ready()
+        self._ticker_streams[symbol] = self._ticker_streams.get(symbol, 0) + 1
+        try:
+            while True:
+                response = await self._exchange.watch_ticker(symbol)
+                self._ticker_received[symbol] = time.monotonic()
+                yield self._to_ticker(symbol, response)
+        finally:
+            await self._release_stream(
+                self._ticker_streams, self._ticker_received, symbol, self._exchange.un_watch_ticker
+            )
+
+    @staticmethod
+    def _is_stream_fresh(received: dict[str, float], symbol: str) -> bool:
+        """購読中のシンボルを _STREAM_MAX_AGE 秒以内に受信しているか."""
+        received_at = received.get(symbol)
+        return received_at is not None and time.monotonic() - received_at < _STREAM_MAX_AGE
+
+    @staticmethod
+    async def _release_stream(
+        streams: dict[str, int],
+        received: dict[str, float],
+        symbol: str,
+        un_watch: Callable[[str], Awaitable[object]],
+    ) -> None:
+        """
+        購読数を減らし、最後の購読であればWebSocketの購読を解除.
+
+        購読解除の失敗はログに記録するのみとし、購読を終了させた元の例外を置き換えない.
+        """
+        streams[symbol] -= 1
+        if streams[symbol] == 0:
+            del streams[symbol]
+            received.pop(symbol, None)
+            try:
+                await un_watch(symbol)
+            except Exception:
+                logger.warning("WebSocketの購読解除に失敗しました: %s", symbol, exc_info=True)
 
     async def get_position(self, symbol: str) -> Position:
         """
@@ -62,48 +290,129 @@ class HyperliquidExchange(IExchange):
         Args:
             symbol: ccxt形式のシンボル（例: "BTC/USDC:USDC"）
         """
-        positions = await self._exchange.fetch_positions([symbol])
+        await self._ensure_ready()
+        positions = await self._fetch_positions(await self._position_dex(symbol))
+        return self._to_position(symbol, positions.get(symbol))
+
+    async def snapshot(self, symbol: str) -> Snapshot:
+        """
+        指定シンボルの価格・ポジション・オーダーブックを並行して取得.
+
+        いずれかの取得に失敗した場合も他のリクエストはキャンセルせず完了を待ち、
+        その後に最初の例外を送出する.
+
+        Args:
+            symbol: ccxt形式のシンボル（例: "BTC/USDC:USDC"）
+        """
+        ticker, position, orderbook = await asyncio.gather(
+            self.get_ticker(symbol),
+            self.get_position(symbol),
+            self.get_orderbook(symbol),
+            return_exceptions=True,
+        )
+        if isinstance(ticker, BaseException):
+            raise ticker
+        if isinstance(position, BaseException):
+            raise position
+        if isinstance(orderbook, BaseException):
+            raise orderbook
+
+        return Snapshot(ticker=ticker, position=position, orderbook=orderbook)
+
+    async def _position_dex(self, symbol: str) -> str | None:
+        """シンボルが属するperp dex名を取得（デフォルトのdexの場合はNone）."""
+        if self._exchange.markets is None:
+            await self._exchange.load_markets()
+        return self._exchange.get_dex_from_hip3_symbol(self._exchange.market(symbol))
+
+    async def _fetch_positions(self, dex: str | None) -> dict[str, dict]:
+        """
+        指定perp dexの全シンボルのポジションをシンボルをキーとした辞書で取得.
 
-        # ポジションがない場合
-        if not positions:
+        ccxtはシンボル指定がない場合デフォルトのdexのみを取得するため、
+        HIP-3のdexはparamsで明示する.
+        結果をdex毎に _POSITIONS_TTL 秒キャッシュし、同時に呼ばれた場合は1回のリクエストを共有する.
+        取得中に注文が発注された場合、結果は注文前の状態の可能性があるためキャッシュしない.
+        """
+        cache = self._positions_cache.get(dex)
+        if cache is not None and time.monotonic() - cache[0] < _POSITIONS_TTL:
+            return cache[1]
+
+        lock = self._positions_locks.get(dex)
+        if lock is None:
+            lock = self._positions_locks[dex] = asyncio.Lock()
+        async with lock:
+            # ロック待ちの間に他の呼び出しが取得済みならそれを使う
+            cache = self._positions_cache.get(dex)
+            if cache is not None and time.monotonic() - cache[0] < _POSITIONS_TTL:
+                return cache[1]
+
+            await self._ensure_ready()
+            generation = self._positions_generation
+            if dex is None:
+                response = await self._exchange.fetch_positions()
+            else:
+                params = self._dex_params.get(dex)
+                if params is None:
+                    params = self._dex_params[dex] = {"dex": dex}
+                response = await self._exchange.fetch_positions(params=params)
+            # 辞書化は取得毎に1回だけ行い、キャッシュ中の参照はO(1)で引く
+            positions = {sys.intern(pos["symbol"]): pos for pos in response}
+            if generation == self._positions_generation:
+                self._positions_cache[dex] = (time.monotonic(), positions)
+            return positions
+
+    def _invalidate_positions(self) -> None:
+        """約定によりポジションが変わるため、キャッシュと取得中の結果を無効にする."""
+        self._positions_generation += 1
+        self._positions_cache.clear()
+
+    @staticmethod
+    def _to_orderbook(response: dict) -> Orderbook:
+        """ccxtのオーダーブックをOrderbookに変換."""
+        ask_px, ask_sz = parse_levels(response["asks"])
+        bid_px, bid_sz = parse_levels(response["bids"])
+        return Orderbook(
+            ask_px=ask_px,
+            ask_sz=ask_sz,
+            bid_px=bid_px,
+            bid_sz=bid_sz,
+            # 戦略ループで参照されるため構築時に計算しておく
+            best_ask=float(ask_px[0]) if ask_px.size else math.nan,
+            best_bid=float(bid_px[0]) if bid_px.size else math.nan,
+        )
+
+    @staticmethod
+    def _to_ticker(symbol: str, response: dict) -> Ticker:
+        """ccxtのティッカーをTickerに変換."""
+        return Ticker(
+            symbol=sys.intern(symbol),
+            last=_to_price(response["last"]),
+            bid=_to_price(response["bid"]),
+            ask=_to_price(response["ask"]),
+        )
+
+    @staticmethod
+    def _to_position(symbol: str, pos: dict | None) -> Position:
+        """ccxtのポジションからPositionを作成（ポジションがない場合はpos=None）."""
+        size = 0.0 if pos is None else _to_float(pos["contracts"])
+        if pos is None or size == 0:
             return Position(
-                symbol=symbol,
+                symbol=sys.intern(symbol),
                 side=None,
                 size=0.0,
                 entry_price=0.0,
                 unrealized_pnl=0.0,
             )
 
-        # 該当シンボルのポジションを探す
-        for pos in positions:
-            if pos["symbol"] == symbol:
-                size = float(pos["contracts"] or 0)
-                if size == 0:
-                    return Position(
-                        symbol=symbol,
-                        side=None,
-                        size=0.0,
-                        entry_price=0.0,
-                        unrealized_pnl=0.0,
-                    )
-
-                # ccxtの"long"/"short"を"Buy"/"Sell"に変換
-                side: Literal["Buy", "Sell"] = "Buy" if pos["side"] == "long" else "Sell"
-                return Position(
-                    symbol=symbol,
-                    side=side,
-                    size=abs(size),
-                    entry_price=float(pos["entryPrice"] or 0),
-                    unrealized_pnl=float(pos["unrealizedPnl"] or 0),
-                )
-
-        # 見つからなかった場合
+        # ccxtの"long"/"short"を"Buy"/"Sell"に変換
+        side: Literal["Buy", "Sell"] = "Buy" if pos["side"] == "long" else "Sell"
         return Position(
-            symbol=symbol,
-            side=None,
-            size=0.0,
-            entry_price=0.0,
-            unrealized_pnl=0.0,
+            symbol=sys.intern(symbol),
+            side=side,
+            size=abs(size),
+            entry_price=_to_float(pos["entryPrice"]),
+            unrealized_pnl=_to_float(pos["unrealizedPnl"]),
         )
 
     async def place_limit_order(self, symbol: str, side: str, amount: float, price: float) -> Order:
@@ -116,6 +425,7 @@ class HyperliquidExchange(IExchange):
             amount: 数量
             price: 価格
         """
+        await self._ensure_ready()
         response = await self._exchange.create_order(
             symbol=symbol,
             type="limit",
@@ -123,9 +433,10 @@ class HyperliquidExchange(IExchange):
             amount=amount,
             price=price,
         )
+        self._invalidate_positions()
         return Order(
-            id=str(response["id"]),
-            symbol=symbol,
+            id=response["id"],  # ccxtがstrに正規化済み
+            symbol=sys.intern(symbol),
             side=side,
             amount=amount,
             price=price,
@@ -141,15 +452,17 @@ class HyperliquidExchange(IExchange):
             side: "buy" or "sell"
             amount: 数量
         """
+        await self._ensure_ready()
         response = await self._exchange.create_order(
             symbol=symbol,
             type="market",
             side=side,
             amount=amount,
         )
+        self._invalidate_positions()
         return Order(
-            id=str(response["id"]),
-            symbol=symbol,
+            id=response["id"],  # ccxtがstrに正規化済み
+            symbol=sys.intern(symbol),
             side=side,
             amount=amount,
             price=None,
@@ -164,29 +477,24 @@ class HyperliquidExchange(IExchange):
             order_id: 注文ID
             symbol: ccxt形式のシンボル
         """
+        await self._ensure_ready()
         await self._exchange.cancel_order(order_id, symbol)
 
     async def get_ohlcv(self, symbol: str, timeframe: str, limit: int) -> list[OHLCV]:
         """
         OHLCVデータを取得.
 
+        欠損値（None）を含むローソク足がある場合は msgspec.ValidationError を送出する.
+
         Args:
             symbol: ccxt形式のシンボル
             timeframe: ローソク足の時間枠（"1m", "5m", "1h"など）
             limit: 取得する本数
         """
+        await self._ensure_ready()
         response = await self._exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
-        return [
-            OHLCV(
-                timestamp=int(candle[0]),
-                open=float(candle[1]),
-                high=float(candle[2]),
-                low=float(candle[3]),
-                close=float(candle[4]),
-                volume=float(candle[5]),
-            )
-            for candle in response
-        ]
+        # 型変換をmsgspecでまとめて行う（数値文字列も受け付ける）
+        return msgspec.convert(response, list[OHLCV], strict=False)
 
     async def get_open_orders(self, symbol: str) -> list[Order]:
         """
@@ -195,19 +503,71 @@ class HyperliquidExchange(IExchange):
         Args:
             symbol: ccxt形式のシンボル
         """
+        await self._ensure_ready()
         response = await self._exchange.fetch_open_orders(symbol)
         return [
             Order(
-                id=str(order["id"]),
-                symbol=order["symbol"],
+                id=order["id"],
+                symbol=sys.intern(order["symbol"]),
                 side=order["side"],
-                amount=float(order["amount"]),
-                price=float(order["price"]) if order["price"] else None,
+                amount=_to_float(order["amount"]),
+                price=_to_float(price) if (price := order["price"]) else None,
                 # status=order.get("status", "open"),
             )
             for order in response
         ]
 
+    async def get_ohlcv_array(self, symbol: str, timeframe: str, limit: int) -> np.ndarray:
+        """
+        OHLCVデータを構造化配列で取得.
+
+        フィールドは timestamp(int64), open, high, low, close, volume(float64).
+        列単位の計算（arr["close"].mean() など）を行う場合は get_ohlcv より効率が良い.
+        欠損値（None）を含むローソク足がある場合は get_ohlcv と同じく msgspec.ValidationError を送出する.
+
+        Args:
+            symbol: ccxt形式のシンボル
+            timeframe: ローソク足の時間枠（"1m", "5m", "1h"など）
+            limit: 取得する本数
+        """
+        await self._ensure_ready()
+        response = await self._exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        return parse_ohlcv(response)
+
+    async def get_ohlcv_many(
+        self, symbols: list[str], timeframe: str, limit: int
+    ) -> dict[str, list[OHLCV] | BaseException]:
+        """
+        複数シンボルのOHLCVデータを並行して取得.
+
+        取得に失敗したシンボルの値には例外オブジェクトが入る.
+
+        Args:
+            symbols: ccxt形式のシンボル一覧
+            timeframe: ローソク足の時間枠（"1m", "5m", "1h"など）
+            limit: 取得する本数
+        """
+        results = await asyncio.gather(
+            *(self.get_ohlcv(symbol, timeframe, limit) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return dict(zip(symbols, results))
+
+    async def get_open_orders_many(self, symbols: list[str]) -> dict[str, list[Order] | BaseException]:
+        """
+        複数シンボルの未約定の注文一覧を並行して取得.
+
+        取得に失敗したシンボルの値には例外オブジェクトが入る.
+
+        Args:
+            symbols: ccxt形式のシンボル一覧
+        """
+        results = await asyncio.gather(
+            *(self.get_open_orders(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return dict(zip(symbols, results))
+
     async def set_leverage(self, symbol: str, leverage: int) -> None:
         """
         レバレッジを設定.
@@ -216,8 +576,11 @@ class HyperliquidExchange(IExchange):
             symbol: ccxt形式のシンボル
             leverage: レバレッジ倍率
         """
+        await self._ensure_ready()
         await self._exchange.set_leverage(leverage, symbol)
 
     async def close(self) -> None:
         """クライアントのリソースをクリーンアップ."""
+        if self._ready is not None and not self._ready.done():
+            self._ready.cancel()
         await self._exchange.close()
@@ -1,21 +1,37 @@
 """取引所の抽象インターフェース定義."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Literal, Self
 
-from pydantic import BaseModel
+import msgspec
+import numpy as np
 
 
-class Ticker(BaseModel):
+def enc_hook(obj: object) -> object:
+    """
+    msgspecのエンコード用フック. np.ndarray をリストに変換する.
+
+    Orderbook / Snapshot は np.ndarray を持つため、シリアライズ時に指定する.
+    例: msgspec.json.encode(orderbook, enc_hook=enc_hook)
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise NotImplementedError(f"Encoding objects of type {type(obj).__name__} is unsupported")
+
+
+# スカラー値のみを持つDTO（Ticker / Position / Order / OHLCV）は循環参照を持たないため
+# gc=False でGCヘッダを省き、インスタンスサイズとGCの走査対象を減らす
+class Ticker(msgspec.Struct, frozen=True, gc=False):
     """価格情報."""
 
     symbol: str
-    last: float  # 最終価格
-    bid: float  # 最良買い気配
-    ask: float  # 最良売り気配
+    last: float  # 最終価格（取得できない場合はNaN）
+    bid: float  # 最良買い気配（取得できない場合はNaN）
+    ask: float  # 最良売り気配（取得できない場合はNaN）
 
 
-class Position(BaseModel):
+class Position(msgspec.Struct, frozen=True, gc=False):
     """ポジション情報."""
 
     symbol: str
@@ -25,7 +41,7 @@ class Position(BaseModel):
     unrealized_pnl: float  # 未実現損益
 
 
-class Order(BaseModel):
+class Order(msgspec.Struct, frozen=True, gc=False):
     """注文情報."""
 
     id: str
@@ -36,8 +52,13 @@ class Order(BaseModel):
     # status: str  # "open" | "closed" | "canceled"
 
 
-class OHLCV(BaseModel):
-    """OHLCVデータ."""
+class OHLCV(msgspec.Struct, frozen=True, array_like=True, gc=False):
+    """
+    OHLCVデータ.
+
+    array_like=True によりccxtのローソク足形式
+    [timestamp, open, high, low, close, volume] と相互変換できる.
+    """
 
     timestamp: int
     open: float
@@ -47,19 +68,62 @@ class OHLCV(BaseModel):
     volume: float
 
 
-class Orderbook(BaseModel):
-    """オーダーブックデータ."""
-
-    asks: list[list[float]]  # [[price, amount], ...]
-    bids: list[list[float]]  # [[price, amount], ...]
-
-    @property
-    def best_ask(self) -> float:
-        return self.asks[0][0]
-
-    @property
-    def best_bid(self) -> float:
-        return self.bids[0][0]
+class Orderbook(msgspec.Struct, frozen=True):
+    """
+    オーダーブックデータ.
+
+    np.ndarray を持つため、msgspecでシリアライズする場合は enc_hook を指定する.
+    比較（==）は配列を要素毎に比較し、NaN同士は等しいとみなす.
+    """
+
+    ask_px: np.ndarray  # 売り気配の価格（昇順）
+    ask_sz: np.ndarray  # 売り気配の数量
+    bid_px: np.ndarray  # 買い気配の価格（降順）
+    bid_sz: np.ndarray  # 買い気配の数量
+    best_ask: float  # 最良売り気配（板が空の場合はNaN）
+    best_bid: float  # 最良買い気配（板が空の場合はNaN）
+
+    def imbalance(self, depth: int | None = None) -> float:
+        """
+        買い/売り数量の偏り (bid - ask) / (bid + ask) を計算（-1.0〜1.0）.
+
+        Args:
+            depth: 集計する板の段数（Noneの場合は全段）
+        """
+        bid = float(self.bid_sz[:depth].sum())
+        ask = float(self.ask_sz[:depth].sum())
+        total = bid + ask
+        return (bid - ask) / total if total else 0.0
+
+    def __eq__(self, other: object) -> bool:
+        """
+        全フィールドが等しいか判定.
+
+        msgspec既定の比較は np.ndarray の真偽値評価で ValueError になるため、
+        np.array_equal で比較する. 板が空の場合の最良気配（NaN）も等しいとみなす.
+        """
+        if not isinstance(other, Orderbook):
+            return NotImplemented
+        return (
+            np.array_equal(self.ask_px, other.ask_px, equal_nan=True)
+            and np.array_equal(self.ask_sz, other.ask_sz, equal_nan=True)
+            and np.array_equal(self.bid_px, other.bid_px, equal_nan=True)
+            and np.array_equal(self.bid_sz, other.bid_sz, equal_nan=True)
+            and np.array_equal(self.best_ask, other.best_ask, equal_nan=True)
+            and np.array_equal(self.best_bid, other.best_bid, equal_nan=True)
+        )
+
+
+class Snapshot(msgspec.Struct, frozen=True):
+    """
+    価格・ポジション・オーダーブックの一括取得結果.
+
+    Orderbook を含むため、msgspecでシリアライズする場合は enc_hook を指定する.
+    """
+
+    ticker: Ticker
+    position: Position
+    orderbook: Orderbook
 
 
 class IExchange(ABC):
@@ -71,6 +135,12 @@ class IExchange(ABC):
         """ファクトリメソッド: 非同期初期化が必要なクライアントを作成."""
         pass
 
+    @classmethod
+    @abstractmethod
+    def create_nowait(cls, config: dict) -> Self:
+        """ファクトリメソッド: 非同期初期化の完了を待たずにクライアントを作成."""
+        pass
+
     @abstractmethod
     async def get_orderbook(self, symbol: str) -> Orderbook:
         """指定シンボルのオーダーブックを取得."""
@@ -81,11 +151,26 @@ class IExchange(ABC):
         """指定シンボルの価格情報を取得."""
         pass
 
+    @abstractmethod
+    def stream_orderbook(self, symbol: str) -> AsyncIterator[Orderbook]:
+        """指定シンボルのオーダーブック更新を購読."""
+        pass
+
+    @abstractmethod
+    def stream_ticker(self, symbol: str) -> AsyncIterator[Ticker]:
+        """指定シンボルの価格情報更新を購読."""
+        pass
+
     @abstractmethod
     async def get_position(self, symbol: str) -> Position:
         """指定シンボルのポジション情報を取得."""
         pass
 
+    @abstractmethod
+    async def snapshot(self, symbol: str) -> Snapshot:
+        """指定シンボルの価格・ポジション・オーダーブックを並行して取得."""
+        pass
+
     @abstractmethod
     async def place_limit_order(self, symbol: str, side: str, amount: float, price: float) -> Order:
         """指値注文を発注."""
@@ -111,6 +196,23 @@ class IExchange(ABC):
         """未約定の注文一覧を取得."""
         pass
 
+    @abstractmethod
+    async def get_ohlcv_array(self, symbol: str, timeframe: str, limit: int) -> np.ndarray:
+        """OHLCVデータを構造化配列で取得."""
+        pass
+
+    @abstractmethod
+    async def get_ohlcv_many(
+        self, symbols: list[str], timeframe: str, limit: int
+    ) -> dict[str, list[OHLCV] | BaseException]:
+        """複数シンボルのOHLCVデータを並行して取得."""
+        pass
+
+    @abstractmethod
+    async def get_open_orders_many(self, symbols: list[str]) -> dict[str, list[Order] | BaseException]:
+        """複数シンボルの未約定の注文一覧を並行して取得."""
+        pass
+
     @abstractmethod
     async def set_leverage(self, symbol: str, leverage: int) -> None:
         """レバレッジを設定."""